@@ -1,25 +1,257 @@
-from google_auth_oauthlib.flow import InstalledAppFlow
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+from googleapiclient.http import BatchHttpRequest
+from googleapiclient.model import JsonModel
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 from langdetect import detect
 from langdetect.lang_detect_exception import LangDetectException
-import yt_dlp
-import json
+import diskcache
+import orjson
+import asyncio
+import atexit
+import functools
+import heapq
 import os
-from datetime import datetime
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from datetime import datetime, timezone
 import re
 
 SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
 
+# Credentials and API client built by the first YouTubeTools instance, shared with
+# later ones. Requests pass each thread's own connection, so sharing the client is safe
+_cached_credentials = None
+_cached_service = None
+
+# How long cached video and playlist metadata stays valid, in seconds
+CACHE_EXPIRY = 86400
+# Search results are reused for a week; clear_cache forces fresh searches sooner
+SEARCH_CACHE_EXPIRY = 7 * 86400
+# Least recently used entries are evicted once the cache grows past this size
+CACHE_SIZE_LIMIT = 500 * 1024 * 1024
+
+# Seconds to wait before writing history, so a burst of updates is written once
+HISTORY_SAVE_DELAY = 1.0
+# Playlists remembered in the history; the oldest is dropped past this
+HISTORY_MAX_ENTRIES = 10
+# Playlist history is an append-only log; once it has this many lines it is
+# rewritten with just the current entries
+HISTORY_COMPACT_LINES = 100
+# Seconds to wait before writing models and learned data after a change
+MODEL_SAVE_DELAY = 1.0
+
+# Requests allowed in flight at once, to stay clear of per-user rate limits
+MAX_CONCURRENT_REQUESTS = 8
+# Steady request rate (per second) and the burst allowed on top of it
+REQUESTS_PER_SECOND = 10
+REQUEST_BURST = 20
+# Times a read request is retried, with exponential backoff, after a 429, a
+# rate-limit 403 or a 5xx. Writes aren't retried, as they may have been applied.
+API_RETRIES = 3
+
+# Partial-response mask for playlist items, limited to the fields callers read
+PLAYLIST_ITEM_FIELDS = 'items(id,snippet(title,resourceId/videoId,videoOwnerChannelId))'
+
+# The list parameter of a playlist (or watch-in-playlist) URL
+PLAYLIST_ID_RE = re.compile(r'(?:^|[?&])list=([^&#]+)')
+
+# ANSI codes used to show result links in blue
+BLUE = '\033[34m'
+RESET = '\033[0m'
+
+# Times appended to YYYY-MM-DD dates to make the RFC 3339 bounds search expects
+DAY_START = 'T00:00:00Z'
+DAY_END = 'T23:59:59Z'
+
+# Duration filter in minutes written as a range, e.g. "60-120"
+DURATION_RANGE_RE = re.compile(r'(\d+)-(\d+)')
+
+# YouTube durations only use the day and time components of ISO 8601 (e.g. PT1H2M3S, P1DT2H),
+# so each designator maps to a fixed number of seconds
+ISO_DURATION_UNITS = {'D': 86400, 'H': 3600, 'M': 60, 'S': 1}
+
+# Generic patterns that suggest the video isn't about the game itself, compiled
+# into one case-insensitive alternation per game type so each text is scanned once
+GENERIC_EXCLUSION_RES = {
+    game_type: re.compile('|'.join(re.escape(pattern) for pattern in patterns), re.IGNORECASE)
+    for game_type, patterns in {
+        'board': [
+            'unboxing only',
+            'collection video',
+            'lot for sale',
+            'printing',
+            'manufacturing'
+        ],
+        'video': [
+            'reaction video',
+            'game bundle',
+            'price guide',
+            'collection video'
+        ]
+    }.items()
+}
+
+# Substrings used by detect_false_contexts to classify frequent phrases: common
+# gaming vocabulary is never excluded, while terms from the other kind of game are
+COMMON_GAMING_TERMS_RE = re.compile('game|play|review|tutorial|guide')
+VIDEO_GAME_TERMS_RE = re.compile('fortnite|minecraft|playstation|xbox|nintendo|steam|dlc|mod')
+BOARD_GAME_TERMS_RE = re.compile('board|card|tabletop|dice')
+
+# Training session menu, written in one go each time it is shown
+TRAINING_MENU = '\n'.join([
+    "\nTraining Options:",
+    "1. Flag result as irrelevant",
+    "2. Mark channel as trusted",
+    "3. Mark channel as noise",
+    "4. Add exclusion phrase for this game",
+    "5. Add persistent exclusion pattern",
+    "6. Remove exclusion",
+    "7. Show current model state",
+    "8. Refresh search with current model",
+    "9. Generate playlist with current settings",
+    "10. Save and exit",
+    ""
+])
+
+# Training session menu choices that change results; the search is refreshed once
+# with choice 8 after any number of them
+REFRESH_CHOICES = frozenset({'1', '2', '3', '4', '5', '6'})
+
+# Options shared by every downloader; _setup_downloader adds the per-call settings
+YDL_OPTIONS = {
+    # Format selection prioritizes:
+    # 1. MP4 video (<=1080p) + M4A audio
+    # 2. Any video (<=1080p) + audio
+    # 3. Best combined format (<=1080p)
+    'format': 'bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=1080]+bestaudio/best[height<=1080]',
+    
+    # Format sorting preferences
+    'format_sort': ['res:1080', 'res:720'],
+    
+    # Merge video and audio automatically
+    'merge_output_format': 'mp4',
+    
+    # Metadata options
+    'writethumbnail': True,
+    'writesubtitles': True,
+    'subtitleslangs': ['en'],
+    'embedthumbnail': True,
+    'embedsubtitles': True,
+    
+    # Output template
+    'outtmpl': '%(title)s [%(resolution)s].%(ext)s',
+    
+    # Transfer tuning: request large HTTP chunks, read with a larger buffer,
+    # and fetch fragments of segmented (DASH/HLS) formats in parallel
+    'http_chunk_size': 10 * 1024 * 1024,
+    'buffersize': 1024 * 1024,
+    'concurrent_fragment_downloads': 4,
+    
+    # Retry transient failures instead of restarting whole downloads
+    'retries': 3,
+    'fragment_retries': 3,
+    'file_access_retries': 3,
+    
+    # Show progress (turned off per downloader when several workers run)
+    'quiet': False,
+    'no_warnings': False,
+    'ignoreerrors': True,
+    
+    # Post-processing
+    'postprocessors': [
+        {'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mp4'},
+        {'key': 'EmbedThumbnail'},
+        {'key': 'FFmpegEmbedSubtitle'},
+    ]
+}
+
 class QuotaConfirmationError(Exception):
     """Raised when user declines a high-quota operation."""
     pass
 
+class OrjsonModel(JsonModel):
+    """API response model that parses JSON bodies with orjson."""
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Leave non-JSON bodies to the stock handling
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
 async def prompt_user(prompt_text):
     """Async wrapper for input function"""
     return input(prompt_text)
 
+class RateLimiter:
+    """Token bucket that spaces out API requests once a burst is used up."""
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = None
+        
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        # Waiters queue on the lock, so requests go out in the order they asked
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class QuotaPolicy:
+    """Decides whether operations with a given quota cost may run."""
+    def __init__(self, auto_approve_under=100, auto_deny_over=None, ask_callback=None):
+        # Costs up to auto_approve_under run without asking; costs above
+        # auto_deny_over are refused without asking (None means never)
+        self.auto_approve_under = auto_approve_under
+        self.auto_deny_over = auto_deny_over
+        self.ask_callback = ask_callback or self._ask
+        # Operations up to this cost were approved for the rest of the session
+        self.session_approved_up_to = 0
+        self._ask_lock = None
+        
+    @staticmethod
+    async def _ask(points, operation_name):
+        print(f"\nHigh-quota operation: {operation_name} will use {points} points")
+        answer = await prompt_user("Continue? (y/n, a = allow this size for the session): ")
+        return answer.strip().lower()
+        
+    async def confirm(self, points, operation_name="API call"):
+        """Return True if an operation costing points may run, asking only when needed."""
+        if self.auto_deny_over is not None and points > self.auto_deny_over:
+            return False
+        if points <= self.auto_approve_under or points <= self.session_approved_up_to:
+            return True
+        # Concurrent searches wait here, so a session approval given to the
+        # first one covers the rest instead of each asking in turn
+        if self._ask_lock is None:
+            self._ask_lock = asyncio.Lock()
+        async with self._ask_lock:
+            if points <= self.session_approved_up_to:
+                return True
+            answer = await self.ask_callback(points, operation_name)
+            if answer == 'a':
+                self.session_approved_up_to = points
+            return answer in ('y', 'a')
+
 class SearchModel:
     """Represents a trained search model for a specific game type."""
     def __init__(self, game_type):
@@ -28,8 +260,15 @@ class SearchModel:
         self.persistent_exclusions = set()
         # Session-specific exclusions (cleared between searches)
         self.session_exclusions = set()
+        # Combined exclusions and a regex matching any of them, built on first use after a change
+        self._all_exclusions = None
+        self._exclusion_re = None
         self.trusted_channels = set()
         self.noise_channels = set()
+        # Sorted copies of the sets above and their comma-joined text, for display,
+        # by attribute name
+        self._sorted_views = {}
+        self._joined_views = {}
         self.scoring_weights = {
             'title_match': 20,
             'view_count': 10,
@@ -50,9 +289,9 @@ class SearchModel:
         """Convert model to dictionary for serialization."""
         return {
             'game_type': self.game_type,
-            'persistent_exclusions': list(self.persistent_exclusions),
-            'trusted_channels': list(self.trusted_channels),
-            'noise_channels': list(self.noise_channels),
+            'persistent_exclusions': sorted(self.persistent_exclusions),
+            'trusted_channels': sorted(self.trusted_channels),
+            'noise_channels': sorted(self.noise_channels),
             'scoring_weights': self.scoring_weights,
             'duration_ranges': self.duration_ranges
         }
@@ -61,10 +300,14 @@ class SearchModel:
     def from_dict(cls, data):
         """Create model from dictionary."""
         model = cls(data['game_type'])
-        model.persistent_exclusions = set(data.get('persistent_exclusions', []))
+        # Exclusions are matched in lowercase; older files may hold mixed case
+        model.persistent_exclusions = {phrase.lower() for phrase in data.get('persistent_exclusions', [])}
+        model._invalidate_exclusions()
         model.trusted_channels = set(data['trusted_channels'])
         model.noise_channels = set(data['noise_channels'])
+        model._invalidate_views('trusted_channels', 'noise_channels')
         model.scoring_weights = data['scoring_weights']
+        model._invalidate_views('scoring_weights')
         model.duration_ranges = data['duration_ranges']
         return model
 
@@ -74,6 +317,7 @@ class SearchModel:
             self.persistent_exclusions.add(phrase.lower())
         else:
             self.session_exclusions.add(phrase.lower())
+        self._invalidate_exclusions()
 
     def remove_exclusion(self, phrase, persistent=False):
         """Remove an exclusion phrase."""
@@ -81,80 +325,145 @@ class SearchModel:
             self.persistent_exclusions.discard(phrase.lower())
         else:
             self.session_exclusions.discard(phrase.lower())
+        self._invalidate_exclusions()
+
+    def _invalidate_exclusions(self):
+        """Drop everything derived from the exclusion sets after they change."""
+        self._all_exclusions = None
+        self._exclusion_re = None
+        self._invalidate_views('persistent_exclusions', 'session_exclusions')
+
+    def _invalidate_views(self, *names):
+        """Drop the cached display copies of the named sets after they change."""
+        for name in names:
+            self._sorted_views.pop(name, None)
+            self._joined_views.pop(name, None)
+
+    def sorted_view(self, name):
+        """Sorted tuple of one of the model's sets (e.g. 'trusted_channels'), cached until it changes."""
+        view = self._sorted_views.get(name)
+        if view is None:
+            view = self._sorted_views[name] = tuple(sorted(getattr(self, name)))
+        return view
+
+    def scoring_weights_text(self):
+        """Scoring weights rendered one per line for display, cached until they change."""
+        text = self._joined_views.get('scoring_weights')
+        if text is None:
+            text = self._joined_views['scoring_weights'] = '\n'.join(
+                f"  {k}: {v}" for k, v in self.scoring_weights.items())
+        return text
+
+    def joined_view(self, name):
+        """Comma-separated, sorted text of one of the model's sets, cached until it changes."""
+        text = self._joined_views.get(name)
+        if text is None:
+            text = self._joined_views[name] = ', '.join(self.sorted_view(name))
+        return text
 
     def get_all_exclusions(self):
-        """Get combined set of persistent and session exclusions."""
-        return self.persistent_exclusions.union(self.session_exclusions)
+        """Get combined frozenset of persistent and session exclusions."""
+        if self._all_exclusions is None:
+            self._all_exclusions = frozenset(self.persistent_exclusions | self.session_exclusions)
+        return self._all_exclusions
+
+    def title_excluded(self, title):
+        """Check a title against every exclusion phrase in a single regex scan."""
+        exclusions = self.get_all_exclusions()
+        if not exclusions:
+            return False
+        if self._exclusion_re is None:
+            # Matching ignores case, so titles don't need lowercasing first
+            self._exclusion_re = re.compile('|'.join(re.escape(phrase) for phrase in exclusions), re.IGNORECASE)
+        return self._exclusion_re.search(title) is not None
 
     def clear_session_exclusions(self):
         """Clear temporary session-specific exclusions."""
         self.session_exclusions.clear()
+        self._invalidate_exclusions()
 
     def add_trusted_channel(self, channel):
         """Add a trusted channel and save the model."""
         self.trusted_channels.add(channel)
         self.noise_channels.discard(channel)  # Remove from noise if present
+        self._invalidate_views('trusted_channels', 'noise_channels')
 
     def add_noise_channel(self, channel):
         """Add a noise channel and save the model."""
         self.noise_channels.add(channel)
         self.trusted_channels.discard(channel)  # Remove from trusted if present
+        self._invalidate_views('trusted_channels', 'noise_channels')
 
 class YouTubeTools:
     SEARCH_PATTERNS = {
         'board': {
-            'how_to_play': [
+            'how_to_play': (
                 '"{game_name}" "how to play"',
                 '"{game_name}" rules explanation',
                 '"{game_name}" tutorial board game',
                 '"{game_name}" learn to play'
-            ],
-            'reviews': [
+            ),
+            'reviews': (
                 '"{game_name}" review board game',
                 '"{game_name}" review card game',
                 '"{game_name}" board game overview',
                 '"{game_name}" first impressions'
-            ],
-            'playthroughs': [
+            ),
+            'playthroughs': (
                 '"{game_name}" playthrough board game',
                 '"{game_name}" gameplay board game',
                 '"{game_name}" full game',
                 '"{game_name}" actual play'
-            ]
+            )
         },
         'video': {
-            'how_to_play': [
+            'how_to_play': (
                 '"{game_name}" beginners guide',
                 '"{game_name}" tutorial',
                 '"{game_name}" getting started',
                 '"{game_name}" basics'
-            ],
-            'reviews': [
+            ),
+            'reviews': (
                 '"{game_name}" review',
                 '"{game_name}" worth playing',
                 '"{game_name}" should you play',
                 '"{game_name}" before you buy'
-            ],
-            'playthroughs': [
+            ),
+            'playthroughs': (
                 '"{game_name}" full gameplay',
                 '"{game_name}" walkthrough no commentary',
                 '"{game_name}" longplay',
                 '"{game_name}" complete game'
-            ]
+            )
         }
     }
 
-    def __init__(self):
-        # Initialize YouTube API client and downloader
+    def __init__(self, max_download_workers=4, quota_policy=None):
+        # Initialize YouTube API client; downloaders are created when downloading
+        self._thread_state = threading.local()
+        # API calls run on a small dedicated pool rather than asyncio's default
+        # executor: idle threads are reused first, so sequential calls keep using
+        # one thread's open connection instead of handshaking on a fresh thread
+        self._request_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS,
+                                                    thread_name_prefix='youtube-api')
+        self._rate_limiter = RateLimiter(REQUESTS_PER_SECOND, REQUEST_BURST)
         self.youtube = self._authenticate()
-        self.downloader = self._setup_downloader()
+        self.max_download_workers = max_download_workers
+        self.cache = diskcache.Cache('.yt_cache', size_limit=CACHE_SIZE_LIMIT,
+                                     eviction_policy='least-recently-used')
         self.session_quota_used = 0
+        self._quota_policy = quota_policy or QuotaPolicy()
         self.DAILY_QUOTA = 10000
-        self.history_file = 'playlist_history.json'
+        self.history_file = 'playlist_history.jsonl'
+        self._history_lock = threading.Lock()
+        self._history_timer = None
         self._load_history()
+        atexit.register(self.flush_history)
         
         # Track last searched game for session management
         self._last_search_game = None
+        # detect_false_contexts results by (game name, game type) for this session
+        self._false_contexts = {}
         
         # New: Channel classification data
         self.trusted_channels = {
@@ -172,6 +481,13 @@ class YouTubeTools:
             'video': set()   # Words that indicate wrong context for video games
         }
         
+        # Model and learned data writes are batched; see _schedule_save
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        self._pending_saves = {}  # path -> function returning the data to write
+        self._saved_data = {}  # path -> bytes last written there
+        atexit.register(self.flush_saves)
+        
         # New: Load learned data if exists
         self._load_learned_data()
         
@@ -182,11 +498,14 @@ class YouTubeTools:
         }
         
     def _authenticate(self):
-        # Try to load existing credentials from token.json
-        creds = None
-        if os.path.exists('token.json'):
+        global _cached_credentials, _cached_service
+        # Reuse credentials from an earlier instance, otherwise load them from token.json
+        creds = _cached_credentials
+        if creds is None:
             try:
                 creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+            except FileNotFoundError:
+                pass
             except Exception:
                 # If token file is corrupted or invalid, remove it
                 os.remove('token.json')
@@ -194,6 +513,9 @@ class YouTubeTools:
         
         # If no valid credentials found, either refresh or create new ones
         if not creds or not creds.valid:
+            # The OAuth flow is only needed without a usable token, so import it lazily
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            
             if creds and creds.expired and creds.refresh_token:
                 try:
                     creds.refresh(Request())
@@ -214,81 +536,178 @@ class YouTubeTools:
             with open('token.json', 'w') as token:
                 token.write(creds.to_json())
         
-        return build('youtube', 'v3', credentials=creds)
+        self._credentials = creds
+        if _cached_service is None or creds is not _cached_credentials:
+            # Use the discovery document bundled with google-api-python-client rather
+            # than fetching it over the network on every start
+            _cached_service = build('youtube', 'v3', http=self._authorized_http(), model=OrjsonModel(),
+                                    cache_discovery=False, static_discovery=True)
+        _cached_credentials = creds
+        return _cached_service
 
-    def _setup_downloader(self):
-        ydl_opts = {
-            # Format selection prioritizes:
-            # 1. MP4 video (<=1080p) + M4A audio
-            # 2. Any video (<=1080p) + audio
-            # 3. Best combined format (<=1080p)
-            'format': 'bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=1080]+bestaudio/best[height<=1080]',
-            
-            # Format sorting preferences
-            'format_sort': ['res:1080', 'res:720'],
-            
-            # Merge video and audio automatically
-            'merge_output_format': 'mp4',
-            
-            # Metadata options
-            'writethumbnail': True,
-            'writesubtitles': True,
-            'subtitleslangs': ['en'],
-            'embedthumbnail': True,
-            'embedsubtitles': True,
-            
-            # Output template
-            'outtmpl': '%(title)s [%(resolution)s].%(ext)s',
-            
-            # Show progress
-            'quiet': False,
-            'no_warnings': False,
-            'ignoreerrors': True,
-            
-            # Post-processing
-            'postprocessors': [
-                {'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mp4'},
-                {'key': 'EmbedThumbnail'},
-                {'key': 'FFmpegEmbedSubtitle'},
-            ]
-        }
+    def _authorized_http(self):
+        # httplib2 keeps the socket to googleapis.com alive between requests. Responses
+        # are cached in self.cache, so httplib2's own file cache is left off
+        return AuthorizedHttp(self._credentials, http=httplib2.Http(timeout=30))
+
+    def _thread_http(self):
+        """Return the calling thread's connection; httplib2 objects aren't thread-safe."""
+        http = getattr(self._thread_state, 'http', None)
+        if http is None:
+            http = self._thread_state.http = self._authorized_http()
+        return http
+
+    async def execute_request(self, request):
+        """Execute an API request (or batch) in a worker thread so the event loop keeps running."""
+        await self._rate_limiter.acquire()
+        loop = asyncio.get_running_loop()
+        if isinstance(request, BatchHttpRequest):
+            execute = lambda: request.execute(http=self._thread_http())
+        else:
+            # The client library backs off and retries rate-limited and failed reads itself
+            retries = API_RETRIES if request.method == 'GET' else 0
+            execute = lambda: request.execute(http=self._thread_http(), num_retries=retries)
+        return await loop.run_in_executor(self._request_executor, execute)
+
+    def _setup_downloader(self, output_dir=None):
+        # yt_dlp is slow to import and only needed for downloads
+        import yt_dlp
+        
+        ydl_opts = dict(YDL_OPTIONS)
+        # Several workers would interleave their progress lines into noise
+        ydl_opts['noprogress'] = self.max_download_workers > 1
+        if output_dir:
+            # Set yt-dlp's home path instead of changing the working directory,
+            # which is shared by every download thread. Unlike prefixing the
+            # output template, this also covers chapter, thumbnail and subtitle files.
+            ydl_opts['paths'] = {'home': os.path.abspath(output_dir)}
         return yt_dlp.YoutubeDL(ydl_opts)
 
-    def extract_playlist_id(self, url_or_id):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def extract_playlist_id(url_or_id):
         """Extract playlist ID from various YouTube URL formats or return the ID if already clean."""
-        if 'list=' in url_or_id:
-            return url_or_id.split('list=')[1].split('&')[0]
-        return url_or_id
+        match = PLAYLIST_ID_RE.search(url_or_id)
+        return match.group(1) if match else url_or_id
+
+    async def iter_playlist_items(self, playlist_id, refresh=False, dedup=True):
+        """Yield playlist items as each page arrives.
+
+        With dedup, only the first entry for each video is yielded. Pages can
+        overlap if the playlist is edited while it is being read, and
+        playlists may also contain the same video more than once.
+        """
+        seen = set()
+        async for item in self._iter_playlist_pages(playlist_id, refresh):
+            if dedup:
+                video_id = item['snippet']['resourceId']['videoId']
+                if video_id in seen:
+                    continue
+                seen.add(video_id)
+            yield item
+
+    async def _iter_playlist_pages(self, playlist_id, refresh=False):
+        """Yield every playlist item, page by page.
 
-    async def get_playlist_items(self, playlist_id, channel_id=None):
-        # Handles YouTube's pagination system (max 50 items per request)
+        Handles YouTube's pagination system (max 50 items per request).
+        Listings are cached on disk and revalidated against the ETag of the
+        first page, so an unchanged playlist costs a single request.
+        """
+        clean_id = self.extract_playlist_id(playlist_id)
+        cache_key = ('playlist_items', clean_id)
+        cached = None if refresh else self.cache.get(cache_key)
         items = []
-        next_page_token = None
         
-        while True:
+        def fetch_page(page_token):
             # Fetch batch of up to 50 items
-            clean_id = self.extract_playlist_id(playlist_id)
             request = self.youtube.playlistItems().list(
                 part='snippet',
                 playlistId=clean_id,
                 maxResults=50,
-                pageToken=next_page_token
+                pageToken=page_token,
+                fields=f'etag,nextPageToken,{PLAYLIST_ITEM_FIELDS}'
             )
-            response = request.execute()
+            return asyncio.ensure_future(self.execute_request(request))
+        
+        pending = fetch_page(None)
+        try:
+            response = await pending
+            etag = response.get('etag')
+            if cached and cached['etag'] == etag:
+                pending = None
+                for item in cached['items']:
+                    yield item
+                return
             
-            # Filter by channel if specified
-            playlist_items = response['items']
-            if channel_id:
-                playlist_items = [
-                    item for item in playlist_items 
-                    if item['snippet']['videoOwnerChannelId'] == channel_id
-                ]
+            while True:
+                # Request the next page before handing out this one, so its round
+                # trip overlaps with whatever the caller does with these items
+                next_page_token = response.get('nextPageToken')
+                pending = fetch_page(next_page_token) if next_page_token else None
+                
+                for item in response['items']:
+                    items.append(item)
+                    yield item
+                
+                if pending is None:
+                    self.cache.set(cache_key, {'etag': etag, 'items': items}, expire=CACHE_EXPIRY)
+                    return
+                response = await pending
+        finally:
+            # Don't leave a prefetch running if the caller stops early
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    async def get_playlist_items(self, playlist_id, channel_id=None, refresh=False, dedup=True):
+        # Filter by channel (if specified) as items arrive, so only matches are kept.
+        # Deleted and private videos have no videoOwnerChannelId.
+        return [
+            item async for item in self.iter_playlist_items(playlist_id, refresh, dedup)
+            if not channel_id or item['snippet'].get('videoOwnerChannelId') == channel_id
+        ]
+
+    async def get_multiple_playlist_items(self, playlist_ids):
+        """Fetch the items of several playlists, keyed by playlist ID.
+
+        Page tokens are only known once the previous page has arrived, so each
+        playlist still pages in order, but every round of page requests across
+        all playlists is sent as a single batch HTTP request.
+        """
+        items = {self.extract_playlist_id(playlist_id): [] for playlist_id in playlist_ids}
+        pending = {clean_id: None for clean_id in items}  # playlist ID -> next page token
+        
+        while pending:
+            next_pending = {}
+            errors = []
             
-            items.extend(playlist_items)
-            next_page_token = response.get('nextPageToken')
+            def handle_page(request_id, response, exception):
+                if exception is not None:
+                    errors.append(exception)
+                    return
+                items[request_id].extend(response['items'])
+                if response.get('nextPageToken'):
+                    next_pending[request_id] = response['nextPageToken']
             
-            if not next_page_token:
-                break
+            # Keep each batch within the API's limit on calls per batch request
+            batch_ids = list(pending)
+            for start in range(0, len(batch_ids), 50):
+                batch = self.youtube.new_batch_http_request(callback=handle_page)
+                for clean_id in batch_ids[start:start + 50]:
+                    batch.add(
+                        self.youtube.playlistItems().list(
+                            part='snippet',
+                            playlistId=clean_id,
+                            maxResults=50,
+                            pageToken=pending[clean_id],
+                            fields=f'nextPageToken,{PLAYLIST_ITEM_FIELDS}'
+                        ),
+                        request_id=clean_id
+                    )
+                await self.execute_request(batch)
+            
+            if errors:
+                raise errors[0]
+            pending = next_pending
         
         return items
 
@@ -305,51 +724,110 @@ class YouTubeTools:
                         'videoId': video_id
                     }
                 }
-            }
+            },
+            # Inserts echo back the whole resource; keep only what identifies the new item
+            fields='id,snippet(playlistId,position,resourceId/videoId)'
         )
-        return request.execute()
+        response = await self.execute_request(request)
+        self._invalidate_playlist_items(clean_id)
+        return response
 
     async def download_playlist(self, playlist_id, output_dir=None):
-        # Create output directory if specified and change to it
+        # Create output directory if specified; downloads are written there
+        # through the output template rather than by changing directory
         if output_dir:
+            output_dir = os.path.abspath(output_dir)
             os.makedirs(output_dir, exist_ok=True)
-            os.chdir(output_dir)
 
-        # Get all videos in playlist and download each one
-        items = await self.get_playlist_items(playlist_id)
-        for item in items:
-            video_id = item['snippet']['resourceId']['videoId']
-            url = f'https://www.youtube.com/watch?v={video_id}'
+        # YoutubeDL instances aren't thread-safe, so each worker builds its own
+        worker_state = threading.local()
+
+        def download_one(url):
+            if not hasattr(worker_state, 'downloader'):
+                worker_state.downloader = self._setup_downloader(output_dir)
             try:
-                self.downloader.download([url])
+                # With ignoreerrors set, failures are reported through the return code
+                return worker_state.downloader.download([url]) == 0
             except Exception as e:
                 print(f"Error downloading {url}: {e}")
+                return False
+
+        # Queue each video for download as soon as its page of the playlist
+        # arrives, so downloading overlaps with fetching the remaining pages
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=self.max_download_workers) as executor:
+            downloads = []
+            async for item in self.iter_playlist_items(playlist_id):
+                url = f'https://www.youtube.com/watch?v={item["snippet"]["resourceId"]["videoId"]}'
+                downloads.append(loop.run_in_executor(executor, download_one, url))
+            results = await asyncio.gather(*downloads)
+        
+        print(f"\nDownloaded {sum(results)} of {len(results)} videos")
 
     async def is_video_in_playlist(self, playlist_id, video_id):
-        # Checks if a video already exists in the playlist to prevent duplicates
-        items = await self.get_playlist_items(playlist_id)
-        return any(
-            item['snippet']['resourceId']['videoId'] == video_id 
-            for item in items
+        # Checks if a video already exists in the playlist to prevent duplicates.
+        # The videoId filter lets YouTube do the lookup, so this is a single
+        # request no matter how long the playlist is.
+        clean_id = self.extract_playlist_id(playlist_id)
+        request = self.youtube.playlistItems().list(
+            part='id',
+            playlistId=clean_id,
+            videoId=video_id,
+            maxResults=1,
+            fields='items(id)'
         )
+        response = await self.execute_request(request)
+        return bool(response.get('items'))
+
+    async def get_playlist_video_ids(self, playlist_id, refresh=False):
+        """Return the set of video IDs in a playlist, for many membership checks at once."""
+        clean_id = self.extract_playlist_id(playlist_id)
+        items = [item async for item in self._iter_playlist_pages(clean_id, refresh)]
+        return frozenset(item['snippet']['resourceId']['videoId'] for item in items)
 
-    async def get_video_details(self, video_id):
-        # Fetches metadata for a single video
+    async def get_video_details(self, video_id, refresh=False):
+        # Fetches metadata for a single video, using the on-disk cache unless refresh is set
+        cache_key = ('video', video_id)
+        if not refresh:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             request = self.youtube.videos().list(
                 part='snippet',
-                id=video_id
+                id=video_id,
+                fields='items(id,snippet(title,channelId,channelTitle,publishedAt))'
             )
-            response = request.execute()
+            response = await self.execute_request(request)
             if response['items']:
+                self.cache.set(cache_key, response['items'][0], expire=CACHE_EXPIRY)
                 return response['items'][0]
             return None
         except Exception as e:
             print(f"Error fetching video details: {e}")
             return None
 
-    async def get_my_playlists(self):
-        """Fetches all playlists owned by the authenticated user, sorted by most recent first."""
+    def _invalidate_playlist_items(self, playlist_id):
+        """Drop a playlist's cached listing after this tool changes the playlist.
+
+        Listings are only revalidated against the first page's ETag, which a
+        change on a later page may leave untouched.
+        """
+        self.cache.delete(('playlist_items', self.extract_playlist_id(playlist_id)))
+
+    def refresh_metadata(self, video_ids):
+        """Drop cached metadata for the given videos so the next lookup hits the API."""
+        for video_id in video_ids:
+            self.cache.delete(('video', video_id))
+            self.cache.delete(('video_stats', video_id))
+
+    def clear_cache(self):
+        """Drop all cached search results and video and playlist metadata."""
+        self.cache.clear()
+
+    async def get_my_playlists(self, limit=None):
+        """Fetches playlists owned by the authenticated user, most recent first; only the newest limit if given."""
         playlists = []
         next_page_token = None
         
@@ -360,24 +838,30 @@ class YouTubeTools:
                     part='snippet,contentDetails',
                     mine=True,
                     maxResults=50,
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields='nextPageToken,items(id,snippet(title,publishedAt),contentDetails/itemCount)'
                 )
-                response = request.execute()
+                response = await self.execute_request(request)
                 
                 for playlist in response['items']:
+                    snippet = playlist['snippet']
                     playlists.append({
                         'id': playlist['id'],
-                        'title': playlist['snippet']['title'],
+                        'title': snippet['title'],
                         'video_count': playlist['contentDetails']['itemCount'],
-                        'created_at': playlist['snippet']['publishedAt']
+                        'created_at': snippet['publishedAt']
                     })
+                # Only the newest playlists are wanted, so keep just those between pages
+                if limit is not None and len(playlists) > limit:
+                    playlists = heapq.nlargest(limit, playlists, key=itemgetter('created_at'))
                 
                 next_page_token = response.get('nextPageToken')
                 if not next_page_token:
                     break
             
-            # Sort by creation date, newest first
-            playlists.sort(key=lambda x: x['created_at'], reverse=True)
+            # Sort by creation date, newest first. publishedAt is an ISO 8601 UTC
+            # timestamp, so comparing the strings orders them chronologically.
+            playlists.sort(key=itemgetter('created_at'), reverse=True)
             return playlists
             
         except Exception as e:
@@ -391,7 +875,8 @@ class YouTubeTools:
             request = self.youtube.playlists().delete(
                 id=clean_id
             )
-            request.execute()
+            await self.execute_request(request)
+            self._invalidate_playlist_items(clean_id)
             return True
         except Exception as e:
             print(f"Error deleting playlist: {e}")
@@ -407,39 +892,72 @@ class YouTubeTools:
                         "title": title,
                         "description": description
                     }
-                }
+                },
+                fields='id'
             )
-            response = request.execute()
+            response = await self.execute_request(request)
             return response['id']
         except Exception as e:
             print(f"Error creating playlist: {e}")
             return None
 
     async def remove_video_from_playlist(self, playlist_id, item_id):
-        """Remove a video from a playlist."""
+        """Remove a video from a playlist.
+
+        The playlist item ID alone identifies the entry; playlist_id names the
+        playlist whose cached listing is dropped.
+        """
         try:
-            clean_id = self.extract_playlist_id(playlist_id)
             request = self.youtube.playlistItems().delete(
                 id=item_id
             )
-            request.execute()
+            await self.execute_request(request)
+            self._invalidate_playlist_items(playlist_id)
             return True
         except Exception as e:
             print(f"Error removing video: {e}")
             return False
 
-    def _parse_duration_filter(self, filter_str):
+    def _enrich_video(self, result, details, min_duration, max_duration):
+        """Add duration and statistics to a video result, or return None if the duration filter rejects it."""
+        has_duration_filter = min_duration is not None or max_duration is not None
+        if not details:
+            # Duration unknown, so it can't satisfy a filter
+            return None if has_duration_filter else result
+        
+        duration_iso = details['contentDetails']['duration']
+        minutes = self._parse_iso_duration(duration_iso)
+        if has_duration_filter:
+            if min_duration is not None and minutes < min_duration:
+                return None
+            if max_duration is not None and minutes > max_duration:
+                return None
+        result.update({
+            'duration': self._format_duration(duration_iso),
+            # Parsed once here so scoring doesn't have to read the display string back
+            'duration_minutes': minutes,
+            'view_count': int(details['statistics'].get('viewCount', 0)),
+            'like_count': int(details['statistics'].get('likeCount', 0))
+        })
+        return result
+
+    def _enrich_playlist(self, result, details, min_duration, max_duration):
+        """Add the video count to a playlist result; playlists aren't filtered by duration."""
+        if details:
+            result['video_count'] = details['contentDetails']['itemCount']
+        return result
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _parse_duration_filter(filter_str):
         """Parse duration filter string into min/max minutes."""
         if not filter_str:
             return None, None
         
         # Handle hyphen format (e.g., "60-120")
-        if '-' in filter_str and ' ' not in filter_str:
-            try:
-                min_duration, max_duration = map(int, filter_str.split('-'))
-                return min_duration, max_duration
-            except ValueError:
-                pass
+        match = DURATION_RANGE_RE.fullmatch(filter_str)
+        if match:
+            return int(match.group(1)), int(match.group(2))
             
         # Handle original format (e.g., ">=60 <=120")
         parts = filter_str.split()
@@ -453,22 +971,36 @@ class YouTubeTools:
             
         return min_duration, max_duration
 
-    def _parse_iso_duration(self, duration):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _iso_duration_seconds(duration):
+        """Convert YouTube's ISO 8601 duration to seconds, or None if it is malformed."""
+        if not duration.startswith('P'):
+            return None
+        # Single pass: accumulate digits, then scale them by the designator that follows
+        total = value = 0
+        for char in duration[1:]:
+            if '0' <= char <= '9':
+                value = value * 10 + ord(char) - 48
+            elif char in ISO_DURATION_UNITS:
+                total += value * ISO_DURATION_UNITS[char]
+                value = 0
+            elif char != 'T':
+                return None
+        return total
+
+    @staticmethod
+    def _parse_iso_duration(duration):
         """Convert YouTube's ISO 8601 duration to minutes."""
-        import re
-        import isodate
-        
-        return int(isodate.parse_duration(duration).total_seconds() / 60)
+        return (YouTubeTools._iso_duration_seconds(duration) or 0) // 60
 
-    def _track_quota(self, points, operation_name="API call"):
+    async def _track_quota(self, points, operation_name="API call"):
+        if not await self._quota_policy.confirm(points, operation_name):
+            raise QuotaConfirmationError("Operation cancelled by user")
+        
+        # Charged only once the operation is allowed to run
         self.session_quota_used += points
         remaining = self.DAILY_QUOTA - self.session_quota_used
-        
-        if points > 100:
-            print(f"\nHigh-quota operation: {operation_name} will use {points} points")
-            confirm = input("Continue? (y/n): ").lower()
-            if confirm != 'y':
-                raise QuotaConfirmationError("Operation cancelled by user")
                 
         if remaining < 1000:
             print(f"\n⚠️ Warning: Used {self.session_quota_used} points in this session")
@@ -482,32 +1014,56 @@ class YouTubeTools:
             'percent_used': (self.session_quota_used / self.DAILY_QUOTA) * 100
         }
         
-    async def advanced_search(self, query, resource_type='video', order='relevance', duration_filter=None, max_results=5, light_mode=True, relevanceLanguage=None):
+    async def advanced_search(self, query, resource_type='video', order='relevance', duration_filter=None, max_results=5, light_mode=True, relevanceLanguage=None,
+                              channel_id=None, published_after=None, published_before=None):
         try:
+            # Repeated searches (same game, same patterns) are served from the cache
+            # without spending any quota
+            cache_key = ('search', ' '.join(query.split()), resource_type, order, duration_filter, max_results,
+                         light_mode, relevanceLanguage, channel_id, published_after, published_before)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
             # Estimate initial quota cost
             base_cost = 100  # Search operation
             estimated_cost = base_cost
             
             if not light_mode:
-                estimated_details_cost = max_results
+                # Details are fetched in bulk: one videos.list and/or playlists.list
+                # call per 50 results, each costing a single point, for each type searched
+                searched_types = (resource_type or 'video,playlist').split(',')
+                detail_types = sum(1 for t in ('video', 'playlist') if t in searched_types)
+                estimated_details_cost = detail_types * -(-max_results // 50)
                 estimated_cost += estimated_details_cost
                 
-            self._track_quota(estimated_cost, "Advanced search")
+            await self._track_quota(estimated_cost, "Advanced search")
             
             min_duration, max_duration = self._parse_duration_filter(duration_filter)
+            has_duration_filter = min_duration is not None or max_duration is not None
             
             # Build search parameters
             params = {
                 'q': query,
-                'maxResults': max_results,  # Only request what we need
+                # Only request what we need, plus headroom when a duration filter will drop some
+                'maxResults': min(50, max_results * 2) if has_duration_filter else max_results,
                 'type': resource_type if resource_type else 'video,playlist',
                 'order': order,
-                'part': 'snippet'
+                'part': 'snippet',
+                'fields': 'items(id,snippet(title,channelTitle,publishedAt))'
             }
             
             # Add language preference if specified
             if relevanceLanguage:
                 params['relevanceLanguage'] = relevanceLanguage
+            
+            # Optional channel and publish date (YYYY-MM-DD) restrictions
+            if channel_id:
+                params['channelId'] = channel_id
+            if published_after:
+                params['publishedAfter'] = published_after + DAY_START
+            if published_before:
+                params['publishedBefore'] = published_before + DAY_END
 
             print(f"\nDebug: YouTube API search parameters:")
             print(f"Query: {params['q']}")
@@ -517,10 +1073,10 @@ class YouTubeTools:
             
             # Execute search
             request = self.youtube.search().list(**params)
-            response = request.execute()
+            response = await self.execute_request(request)
             
-            # For each video, get additional details
-            detailed_results = []
+            # Build the basic result for each search hit
+            candidates = []
             for item in response.get('items', []):
                 # Get the type and ID from the response
                 content_type = item['id']['kind'].split('#')[1]  # 'youtube#video' or 'youtube#playlist'
@@ -529,116 +1085,231 @@ class YouTubeTools:
                 if not content_id:
                     continue
                     
-                result = {
+                candidates.append({
                     'id': content_id,
                     'type': content_type,  # Add explicit type field
                     'url': f'https://www.youtube.com/watch?v={content_id}' if content_type == 'video' else f'https://www.youtube.com/playlist?list={content_id}',
                     'title': item['snippet']['title'],
                     'channel_title': item['snippet']['channelTitle'],
                     'upload_date': item['snippet']['publishedAt']
-                }
-                
-                # Get additional details based on type
-                if content_type == 'video':
-                    video_response = self.youtube.videos().list(
+                })
+            
+            # Without a duration filter every candidate is kept, so trim before fetching details
+            if not has_duration_filter:
+                candidates = candidates[:max_results]
+            
+            # Use details cached by earlier searches where we have them
+            video_details = {}
+            playlist_details = {}
+            for result in candidates:
+                cached = self.cache.get((f"{result['type']}_stats", result['id']))
+                if cached is not None:
+                    details = video_details if result['type'] == 'video' else playlist_details
+                    details[result['id']] = cached
+            
+            # Fetch the rest in bulk. Each list call accepts up to 50 comma-separated
+            # IDs, and the calls for both types go out as one batch request
+            video_ids = [r['id'] for r in candidates if r['type'] == 'video' and r['id'] not in video_details]
+            playlist_ids = [r['id'] for r in candidates if r['type'] == 'playlist' and r['id'] not in playlist_details]
+            errors = []
+            
+            def handle_details(request_id, response, exception):
+                if exception is not None:
+                    errors.append(exception)
+                    return
+                content_type = 'video' if request_id.startswith('videos') else 'playlist'
+                details = video_details if content_type == 'video' else playlist_details
+                for entry in response['items']:
+                    details[entry['id']] = entry
+                    self.cache.set((f'{content_type}_stats', entry['id']), entry, expire=CACHE_EXPIRY)
+            
+            batch = self.youtube.new_batch_http_request(callback=handle_details)
+            for start in range(0, len(video_ids), 50):
+                batch.add(
+                    self.youtube.videos().list(
                         part='statistics,contentDetails',
-                        id=content_id
-                    ).execute()
-                    
-                    if video_response['items']:
-                        video_details = video_response['items'][0]
-                        result.update({
-                            'duration': self._format_duration(video_details['contentDetails']['duration']),
-                            'view_count': int(video_details['statistics'].get('viewCount', 0)),
-                            'like_count': int(video_details['statistics'].get('likeCount', 0))
-                        })
-                else:  # playlist
-                    playlist_response = self.youtube.playlists().list(
+                        id=','.join(video_ids[start:start + 50]),
+                        fields='items(id,contentDetails/duration,statistics(viewCount,likeCount))'
+                    ),
+                    request_id=f'videos-{start}'
+                )
+            for start in range(0, len(playlist_ids), 50):
+                batch.add(
+                    self.youtube.playlists().list(
                         part='contentDetails',
-                        id=content_id
-                    ).execute()
-                    
-                    if playlist_response['items']:
-                        result.update({
-                            'video_count': playlist_response['items'][0]['contentDetails']['itemCount']
-                        })
-                
-                detailed_results.append(result)
-                
+                        id=','.join(playlist_ids[start:start + 50]),
+                        maxResults=50,
+                        fields='items(id,contentDetails/itemCount)'
+                    ),
+                    request_id=f'playlists-{start}'
+                )
+            if video_ids or playlist_ids:
+                await self.execute_request(batch)
+            if errors:
+                raise errors[0]
+            
+            # Attach details based on type, stopping once we have enough results
+            enrichers = {
+                'video': (self._enrich_video, video_details),
+                'playlist': (self._enrich_playlist, playlist_details)
+            }
+            detailed_results = []
+            for result in candidates:
                 if len(detailed_results) >= max_results:
                     break
                 
+                enricher, details = enrichers[result['type']]
+                result = enricher(result, details.get(result['id']), min_duration, max_duration)
+                if result is not None:
+                    detailed_results.append(result)
+                
+            self.cache.set(cache_key, detailed_results, expire=SEARCH_CACHE_EXPIRY)
             return detailed_results
             
         except Exception as e:
             print(f"Error in advanced search: {e}")
             return None
 
-    def _format_duration(self, duration_iso):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_duration(duration_iso):
         """Convert ISO 8601 duration to readable format."""
-        match = re.match(r'PT(\d+H)?(\d+M)?(\d+S)?', duration_iso)
-        if not match:
+        total = YouTubeTools._iso_duration_seconds(duration_iso)
+        if total is None:
             return 'Unknown'
         
-        hours = match.group(1)[:-1] if match.group(1) else 0
-        minutes = match.group(2)[:-1] if match.group(2) else 0
-        seconds = match.group(3)[:-1] if match.group(3) else 0
+        hours, remainder = divmod(total, 3600)
+        minutes, seconds = divmod(remainder, 60)
         
         parts = []
-        if int(hours):
+        if hours:
             parts.append(f"{hours}h")
-        if int(minutes):
+        if minutes:
             parts.append(f"{minutes}m")
-        if int(seconds):
+        if seconds:
             parts.append(f"{seconds}s")
         
         return " ".join(parts)
 
     def _load_history(self):
-        """Load playlist history from file"""
+        """Load playlist history by replaying the log, oldest entry first"""
+        self.playlist_history = OrderedDict()
+        self._pending_history = []
+        self._history_lines = 0
         try:
-            if os.path.exists(self.history_file):
-                with open(self.history_file, 'r') as f:
-                    self.playlist_history = json.load(f)
-            else:
-                self.playlist_history = []
-        except:
-            self.playlist_history = []
+            with open(self.history_file, 'rb') as f:
+                for line in f:
+                    self._history_lines += 1
+                    try:
+                        entry = orjson.loads(line)
+                        self.playlist_history.pop(entry['id'], None)
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        # An append cut short by a crash, or a line that isn't a history
+                        # entry, only loses its own line. Compact on the next save so new
+                        # entries don't land on the broken line
+                        self._history_lines = HISTORY_COMPACT_LINES
+                        continue
+                    self.playlist_history[entry['id']] = entry
+                    # Trim while replaying so a long log never builds a large history
+                    if len(self.playlist_history) > HISTORY_MAX_ENTRIES:
+                        self.playlist_history.popitem(last=False)
+        except FileNotFoundError:
+            self._load_legacy_history()
+        except OSError as e:
+            print(f"Warning: Could not read playlist history from {self.history_file}: {e}")
+        
+        # Keep only the most recent entries (the legacy import isn't trimmed as it goes)
+        while len(self.playlist_history) > HISTORY_MAX_ENTRIES:
+            self.playlist_history.popitem(last=False)
 
-    def _save_history(self):
-        """Save playlist history to file"""
+    def _load_legacy_history(self):
+        """Import history saved by older versions as a JSON list, most recent first"""
+        legacy_file = 'playlist_history.json'
+        if not os.path.exists(legacy_file):
+            return
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.playlist_history, f)
-            print(f"Debug: Saved {len(self.playlist_history)} items to history")  # Temporary debug line
-        except Exception as e:
-            print(f"Debug: Failed to save history: {e}")  # Temporary debug line
-            pass
+            with open(legacy_file, 'rb') as f:
+                entries = orjson.loads(f.read())
+            for entry in reversed(entries):
+                self.playlist_history[entry['id']] = entry
+            self._compact_history()
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not import playlist history from {legacy_file}: {e}")
+
+    @staticmethod
+    def _write_atomic(path, data):
+        """Write bytes to path through a temporary file, so a crash never leaves it half-written."""
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _compact_history(self):
+        """Rewrite the history log with only the current entries."""
+        self._write_atomic(self.history_file,
+                           b''.join(orjson.dumps(entry) + b'\n' for entry in self.playlist_history.values()))
+        self._history_lines = len(self.playlist_history)
+
+    def _save_history(self):
+        """Schedule a history write; updates made before it runs share the write."""
+        with self._history_lock:
+            if self._history_timer is None:
+                self._history_timer = threading.Timer(HISTORY_SAVE_DELAY, self.flush_history)
+                self._history_timer.daemon = True
+                self._history_timer.start()
+
+    def flush_history(self):
+        """Append pending history entries to disk now."""
+        with self._history_lock:
+            if self._history_timer is None:
+                return
+            self._history_timer.cancel()
+            self._history_timer = None
+            try:
+                if self._history_lines + len(self._pending_history) > HISTORY_COMPACT_LINES:
+                    self._compact_history()
+                else:
+                    with open(self.history_file, 'ab') as f:
+                        f.write(b''.join(orjson.dumps(entry) + b'\n' for entry in self._pending_history))
+                    self._history_lines += len(self._pending_history)
+                self._pending_history = []
+            except OSError as e:
+                print(f"Error saving playlist history: {e}")
 
     def add_to_history(self, playlist_id, title):
         """Add playlist to history, maintaining uniqueness and limiting size"""
         clean_id = self.extract_playlist_id(playlist_id)
-        print(f"Debug: Adding playlist to history: {title} ({clean_id})")  # Temporary debug line
-        # Remove if already exists
-        self.playlist_history = [p for p in self.playlist_history if p['id'] != clean_id]
-        # Add to front of list
-        self.playlist_history.insert(0, {
-            'id': clean_id,
-            'title': title,
-            'last_used': datetime.now().isoformat()
-        })
-        # Keep only last 10 items
-        self.playlist_history = self.playlist_history[:10]
+        with self._history_lock:
+            # Move to the most recent end, replacing any earlier entry
+            entry = {
+                'id': clean_id,
+                'title': title,
+                'last_used': datetime.now().isoformat()
+            }
+            self.playlist_history.pop(clean_id, None)
+            self.playlist_history[clean_id] = entry
+            self._pending_history.append(entry)
+            # Keep only the most recent entries
+            while len(self.playlist_history) > HISTORY_MAX_ENTRIES:
+                self.playlist_history.popitem(last=False)
         self._save_history()
 
+    def recent_playlists(self):
+        """Return playlist history entries, most recently used first."""
+        return list(reversed(self.playlist_history.values()))
+
     def display_results(self, results, category_name=None):
         """Display search results with detailed information."""
         if not results:
             print(f"\nNo {category_name} results found.")
             return ""
 
-        # Print appropriate header based on category
-        print(f"\nAvailable {category_name}:")
+        # Build the whole listing, starting with a header for the category, and
+        # write it at once rather than printing line by line
+        out = [f"\nAvailable {category_name}:\n"]
+        separator = "   " + "-" * 50 + "\n"
         
         for i, item in enumerate(results, 1):
             duration = item.get('duration', 'Unknown')
@@ -651,16 +1322,19 @@ class YouTubeTools:
             # Different display format for playlists vs videos
             if item.get('type') == 'playlist':
                 video_count = item.get('video_count', 'Unknown')
-                print(f"\n{i}. [PLAYLIST] {item['title']}")
-                print(f"   Channel: {item['channel_title']} ({channel_subs:,} subscribers)")
-                print(f"   Videos: {video_count} | Views: {views:,} | Created: {upload_date}")
+                out.append(f"\n{i}. [PLAYLIST] {item['title']}\n"
+                           f"   Channel: {item['channel_title']} ({channel_subs:,} subscribers)\n"
+                           f"   Videos: {video_count} | Views: {views:,} | Created: {upload_date}\n")
             else:
-                print(f"\n{i}. {item['title']}")
-                print(f"   Channel: {item['channel_title']} ({channel_subs:,} subscribers)")
-                print(f"   Duration: {duration} | Views: {views:,} | Like ratio: {ratio} | Uploaded: {upload_date}")
+                out.append(f"\n{i}. {item['title']}\n"
+                           f"   Channel: {item['channel_title']} ({channel_subs:,} subscribers)\n"
+                           f"   Duration: {duration} | Views: {views:,} | Like ratio: {ratio} | Uploaded: {upload_date}\n")
             
-            print(f"   \033[34m{item['url']}\033[0m")  # Blue clickable link
-            print("   " + "-" * 50)
+            out.append(f"   {BLUE}{item['url']}{RESET}\n")  # Blue clickable link
+            out.append(separator)
+        
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
 
         while True:
             print("\nTip: Enter numbers/ranges separated by commas (e.g., '1,3' or '1-3' or '1,2-4')")
@@ -732,38 +1406,26 @@ class YouTubeTools:
         if model.noise_channels:
             print("Noise channels:", ', '.join(model.noise_channels))
 
-        # 1. How to Play videos
-        print(f"\nSearching for tutorials...")
-        tutorial_results = await self.search_videos(
-            game_name=game_name,
-            game_type=game_type_str,
-            category='how_to_play'
+        # The three category searches are independent, so run them together and
+        # only prompt for selections once all of them are back
+        print(f"\nSearching for tutorials, tips & tricks, and playthroughs...")
+        tutorial_results, tips_results, playthrough_results = await asyncio.gather(
+            # 1. How to Play videos
+            self.search_videos(game_name=game_name, game_type=game_type_str, category='how_to_play'),
+            # 2. Tips & Tricks videos
+            self.search_videos(game_name=game_name, game_type=game_type_str, category='reviews'),
+            # 3. Playthrough videos/playlists
+            self.search_videos(game_name=game_name, game_type=game_type_str, category='playthroughs')
         )
         
         print("\n=== How to Play Videos ===")
         formatted_tutorials = [video for video, score in tutorial_results]
         selected_tutorials = self.display_results(formatted_tutorials, "How to Play Videos")
         
-        # 2. Tips & Tricks videos
-        print(f"\nSearching for tips & tricks...")
-        tips_results = await self.search_videos(
-            game_name=game_name,
-            game_type=game_type_str,
-            category='reviews'
-        )
-        
         print("\n=== Tips & Tricks Videos ===")
         formatted_tips = [video for video, score in tips_results]
         selected_tips = self.display_results(formatted_tips, "Tips & Tricks")
         
-        # 3. Playthrough videos/playlists
-        print(f"\nSearching for playthroughs...")
-        playthrough_results = await self.search_videos(
-            game_name=game_name,
-            game_type=game_type_str,
-            category='playthroughs'
-        )
-        
         print("\n=== Playthroughs ===")
         formatted_playthroughs = [video for video, score in playthrough_results]
         selected_playthroughs = self.display_results(formatted_playthroughs, "Playthroughs")
@@ -807,12 +1469,26 @@ class YouTubeTools:
                 else:
                     indices.append(int(part))
             
-            for idx in indices:
-                item = results[idx - 1]
+            selected = [results[idx - 1] for idx in indices]
+            
+            # Fetch the contents of every selected playlist at once, each only once
+            # even if it was picked twice (e.g. "3,1-4")
+            playlist_ids = list(dict.fromkeys(item['id'] for item in selected if item.get('type') == 'playlist'))
+            fetched = await asyncio.gather(
+                *(self.get_playlist_items(playlist_id) for playlist_id in playlist_ids),
+                return_exceptions=True
+            )
+            playlist_contents = dict(zip(playlist_ids, fetched))
+            
+            # Inserts stay sequential: they keep the selected order, and YouTube
+            # rejects concurrent writes to the same playlist
+            for item in selected:
                 try:
                     if item.get('type') == 'playlist':
                         print(f"\nAdding playlist: {item['title']}")
-                        playlist_items = await self.get_playlist_items(item['id'])
+                        playlist_items = playlist_contents[item['id']]
+                        if isinstance(playlist_items, Exception):
+                            raise playlist_items
                         for video in playlist_items:
                             video_id = video['snippet']['resourceId']['videoId']
                             if video_id not in added_video_ids:
@@ -851,36 +1527,16 @@ class YouTubeTools:
 
     def filter_irrelevant_results(self, videos, game_name, game_type):
         """Pre-filter obviously irrelevant results using generic patterns."""
-        
-        # Generic patterns that suggest the video isn't about the game itself
-        GENERIC_EXCLUSIONS = {
-            'board': [
-                'unboxing only',
-                'collection video',
-                'lot for sale',
-                'printing',
-                'manufacturing'
-            ],
-            'video': [
-                'reaction video',
-                'game bundle',
-                'price guide',
-                'collection video'
-            ]
-        }
-
         filtered = []
-        generic_exclusions = GENERIC_EXCLUSIONS[game_type]
+        generic_exclusion_re = GENERIC_EXCLUSION_RES[game_type]
         
         for video in videos:
-            # Check title and description for generic exclusion patterns
-            lower_title = video['title'].lower()
+            # Skip if the title or description matches generic exclusion patterns.
+            # The title is checked first, so rejected titles never touch the description.
+            if generic_exclusion_re.search(video['title']):
+                continue
             # Get description from snippet if available, otherwise use empty string
-            lower_desc = video.get('snippet', {}).get('description', '').lower()
-            
-            # Skip if it matches generic exclusion patterns
-            if any(pattern in lower_title or pattern in lower_desc 
-                   for pattern in generic_exclusions):
+            if generic_exclusion_re.search(video.get('snippet', {}).get('description', '')):
                 continue
             
             filtered.append(video)
@@ -891,29 +1547,85 @@ class YouTubeTools:
         """Load previously learned channel and exclusion data."""
         try:
             if os.path.exists('learned_data.json'):
-                with open('learned_data.json', 'r') as f:
-                    data = json.load(f)
+                with open('learned_data.json', 'rb') as f:
+                    data = orjson.loads(f.read())
                     self.trusted_channels = {k: set(v) for k, v in data.get('trusted_channels', {}).items()}
                     self.noise_channels = {k: set(v) for k, v in data.get('noise_channels', {}).items()}
-                    self.learned_exclusions = {k: set(v) for k, v in data.get('learned_exclusions', {}).items()}
+                    self.learned_exclusions = {k: {phrase.lower() for phrase in v}
+                                               for k, v in data.get('learned_exclusions', {}).items()}
         except Exception as e:
             print(f"Error loading learned data: {e}")
 
+    def _learned_data(self):
+        """Learned channel and exclusion data in its saved form."""
+        return {
+            'trusted_channels': {k: sorted(v) for k, v in self.trusted_channels.items()},
+            'noise_channels': {k: sorted(v) for k, v in self.noise_channels.items()},
+            'learned_exclusions': {k: sorted(v) for k, v in self.learned_exclusions.items()}
+        }
+
     def _save_learned_data(self):
         """Save learned channel and exclusion data."""
-        try:
-            data = {
-                'trusted_channels': {k: list(v) for k, v in self.trusted_channels.items()},
-                'noise_channels': {k: list(v) for k, v in self.noise_channels.items()},
-                'learned_exclusions': {k: list(v) for k, v in self.learned_exclusions.items()}
-            }
-            with open('learned_data.json', 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving learned data: {e}")
+        self._schedule_save('learned_data.json', self._learned_data)
+
+    def _schedule_save(self, path, get_data):
+        """Schedule a JSON file write; changes made before it runs share the write."""
+        with self._save_lock:
+            self._pending_saves[path] = get_data
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(MODEL_SAVE_DELAY, self.flush_saves)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush_saves(self):
+        """Write pending model and learned data files now, skipping unchanged ones."""
+        with self._save_lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+            pending, self._pending_saves = self._pending_saves, {}
+            for path, get_data in pending.items():
+                try:
+                    data = orjson.dumps(get_data(), option=orjson.OPT_INDENT_2)
+                    if self._saved_data.get(path) == data:
+                        continue
+                    self._write_atomic(path, data)
+                    self._saved_data[path] = data
+                except Exception as e:
+                    print(f"Error saving {path}: {e}")
+
+    @staticmethod
+    def _count_phrases(results):
+        """Count 1-3 word phrases and channels across search results."""
+        # Analyze titles and descriptions for common patterns
+        phrase_counts = Counter()
+        channel_counts = Counter()
+        
+        for video in results:
+            # Get text from title and description
+            text = f"{video['title']} {video.get('snippet', {}).get('description', '')}"
+            text = text.lower()
+            
+            # Track channel frequencies
+            channel_counts[video['channel_title']] += 1
+            
+            # Extract phrases (1-3 words) and count frequencies, ignoring very short
+            # ones (3 characters or less; three word phrases are always longer)
+            words = text.split()
+            phrase_counts.update(word for word in words if len(word) > 3)
+            phrase_counts.update(f"{a} {b}" for a, b in zip(words, words[1:]) if len(a) + len(b) > 2)
+            phrase_counts.update(f"{a} {b} {c}" for a, b, c in zip(words, words[1:], words[2:]))
+        
+        return phrase_counts, channel_counts
 
     async def detect_false_contexts(self, game_name, game_type, training_mode=False):
         """Perform initial search to detect irrelevant contexts that should be excluded."""
+        # Reuse this session's analysis unless the user wants to walk through it again
+        cache_key = (game_name.lower(), game_type)
+        if not training_mode and cache_key in self._false_contexts:
+            return list(self._false_contexts[cache_key])
+        
         # Do a broad search but include game type for better initial results
         initial_query = f'"{game_name}" {game_type} game'
         results = await self.advanced_search(initial_query, max_results=15)
@@ -921,36 +1633,21 @@ class YouTubeTools:
         if not results:
             return []
 
-        # Analyze titles and descriptions for common patterns
-        phrase_counts = {}
-        channel_counts = {}
-        
         if training_mode:
             print("\nAnalyzing initial results for false contexts...")
-            
-        for video in results:
-            # Get text from title and description
-            text = f"{video['title']} {video.get('snippet', {}).get('description', '')}"
-            text = text.lower()
-            
-            # Track channel frequencies
-            channel = video['channel_title']
-            channel_counts[channel] = channel_counts.get(channel, 0) + 1
-            
-            if training_mode:
+            for video in results:
                 print(f"\nAnalyzing video: {video['title']}")
-                print(f"Channel: {channel}")
-            
-            # Extract phrases (1-3 words) and count frequencies
-            words = text.split()
-            for i in range(len(words)):
-                for phrase_len in range(1, 4):  # Look for 1-3 word phrases
-                    if i + phrase_len <= len(words):
-                        phrase = ' '.join(words[i:i+phrase_len])
-                        if len(phrase) > 3:  # Ignore very short phrases
-                            phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
-                            if training_mode and phrase_counts[phrase] >= 3:
-                                print(f"Frequent phrase found: '{phrase}' (count: {phrase_counts[phrase]})")
+                print(f"Channel: {video['channel_title']}")
+        
+        # Counting is pure CPU work, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        phrase_counts, channel_counts = await loop.run_in_executor(None, self._count_phrases, results)
+        
+        if training_mode:
+            for phrase, count in phrase_counts.most_common():
+                if count < 3:
+                    break
+                print(f"Frequent phrase found: '{phrase}' (count: {count})")
 
         # Find phrases that frequently appear with the game name but likely indicate wrong context
         game_words = set(game_name.lower().split())
@@ -960,20 +1657,24 @@ class YouTubeTools:
         exclusions.extend(self.learned_exclusions[game_type])
         
         for phrase, count in phrase_counts.items():
+            # Only phrases that appear in multiple videos are candidates
+            if count < 3:
+                continue
+            
             # Skip if it's part of the game name
-            if any(word in game_words for word in phrase.split()):
+            if not game_words.isdisjoint(phrase.split()):
                 continue
             
-            # If phrase appears in multiple videos and isn't a common gaming term
-            if count >= 3 and not any(term in phrase for term in {'game', 'play', 'review', 'tutorial', 'guide', 'gameplay'}):
+            # If phrase isn't a common gaming term
+            if not COMMON_GAMING_TERMS_RE.search(phrase):
                 # Check if it's a game-specific term
                 if game_type == 'board':
-                    if any(term in phrase for term in {'fortnite', 'minecraft', 'playstation', 'xbox', 'nintendo', 'steam', 'dlc', 'mod'}) or phrase in self.learned_exclusions['board']:
+                    if VIDEO_GAME_TERMS_RE.search(phrase) or phrase in self.learned_exclusions['board']:
                         exclusions.append(phrase)
                         if training_mode:
                             print(f"Excluding '{phrase}' (appeared {count} times, known video game term)")
                 else:  # video game
-                    if any(term in phrase for term in {'board', 'card', 'tabletop', 'boardgame', 'cardgame', 'dice'}) or phrase in self.learned_exclusions['video']:
+                    if BOARD_GAME_TERMS_RE.search(phrase) or phrase in self.learned_exclusions['video']:
                         exclusions.append(phrase)
                         if training_mode:
                             print(f"Excluding '{phrase}' (appeared {count} times, known board game term)")
@@ -1004,7 +1705,7 @@ class YouTubeTools:
                 if not action:
                     break
                     
-                if action.lower() == 'n':
+                if action in ('n', 'N'):
                     noise_num = await prompt_user("Enter channel number to mark as noise (or Enter to skip): ")
                     if noise_num:
                         try:
@@ -1027,7 +1728,9 @@ class YouTubeTools:
                     except ValueError:
                         print("Invalid input. Please enter a number.")
 
-        return list(set(exclusions))  # Remove duplicates
+        exclusions = list(set(exclusions))  # Remove duplicates
+        self._false_contexts[cache_key] = exclusions
+        return list(exclusions)
 
     def add_trusted_channel(self, channel_name, game_type):
         """Add a channel to the trusted list for a game type."""
@@ -1053,6 +1756,8 @@ class YouTubeTools:
         # Also add to learned data for compatibility
         self.learned_exclusions[game_type].add(word.lower())
         self._save_learned_data()
+        # Detected contexts include the learned exclusions
+        self._false_contexts.clear()
 
     def remove_exclusion_word(self, word, game_type):
         """Remove a word from the learned exclusions for a game type."""
@@ -1064,6 +1769,8 @@ class YouTubeTools:
         # Also remove from learned data for compatibility
         self.learned_exclusions[game_type].discard(word.lower())
         self._save_learned_data()
+        # Detected contexts include the learned exclusions
+        self._false_contexts.clear()
 
     async def training_search(self, game_name, game_type):
         """Perform a search with detailed output for training purposes."""
@@ -1078,8 +1785,9 @@ class YouTubeTools:
         # Build search query with exclusions
         search_parts = [base_query]
         
-        # Add exclusions to query
-        exclusions = model.get_all_exclusions()
+        # Add exclusions to query, sorted so the same model always builds the
+        # same query string and hits the search cache across sessions
+        exclusions = sorted(model.get_all_exclusions())
         if exclusions:
             # YouTube API syntax for exclusions is -word
             exclusion_terms = [f'-"{phrase}"' for phrase in exclusions]
@@ -1087,7 +1795,7 @@ class YouTubeTools:
             print(f"\nApplying exclusions: {', '.join(exclusions)}")
         
         # Add trusted channels to query if any
-        trusted_channels = model.trusted_channels
+        trusted_channels = model.sorted_view('trusted_channels')
         if trusted_channels:
             # YouTube API syntax for channel filter
             channel_parts = [f'channel:"{channel}"' for channel in trusted_channels]
@@ -1140,7 +1848,7 @@ class YouTubeTools:
             # Try language detection on title and description
             try:
                 # Check title language
-                title_lang = detect(title)
+                title_lang = self._detect_language(title)
                 if title_lang != 'en':
                     lang_name = LANG_NAMES.get(title_lang, title_lang.upper())
                     print(f"⚠️  Filtered - {lang_name} title: {title}")
@@ -1148,7 +1856,7 @@ class YouTubeTools:
                 
                 # If description exists and is long enough, check its language too
                 if len(description) > 50:
-                    desc_lang = detect(description)
+                    desc_lang = self._detect_language(description)
                     if desc_lang != 'en':
                         lang_name = LANG_NAMES.get(desc_lang, desc_lang.upper())
                         print(f"⚠️  Filtered - {lang_name} description: {title}")
@@ -1170,6 +1878,7 @@ class YouTubeTools:
             return
             
         print(f"\nShowing {len(results)} results after filtering:")
+        name_re = self._game_name_re(game_name)
         for i, result in enumerate(results, 1):
             print(f"\n{i}. {result['title']}")
             print(f"   Channel: {result['channel_title']}")
@@ -1180,7 +1889,7 @@ class YouTubeTools:
             print("   Scoring factors:")
             
             # Title match
-            if re.search(rf'\b{re.escape(game_name)}\b', result['title'], re.IGNORECASE):
+            if name_re.search(result['title']):
                 print("   + Title exact match: +20")
                 score += 20
                 
@@ -1202,9 +1911,7 @@ class YouTubeTools:
                 
             # Duration appropriateness
             if 'duration' in result:
-                duration_str = result['duration']
-                minutes = sum(x * int(t) for x, t in zip([60, 1], re.findall(r'(\d+)[hm]', duration_str)))
-                print(f"   Duration: {duration_str}")
+                print(f"   Duration: {result['duration']}")
                 
             print(f"   Final score: {score}")
             
@@ -1216,42 +1923,48 @@ class YouTubeTools:
         
         # Get the model and its exclusions
         model = self.models[game_type]
-        model_exclusions = model.get_all_exclusions()
+        model_exclusions = sorted(model.get_all_exclusions())
         
-        all_results = []
+        best_results = {}  # video ID -> (video, score), keeping the best score across patterns
         patterns = self.SEARCH_PATTERNS[game_type][category]
         
         print(f"\nDebug: Using {len(patterns)} search patterns for {category}")
         
+        # Exclusions and trusted channels are the same for every pattern. Both are
+        # sorted so the query string, and so the search cache key, is stable across sessions
+        search_suffix = []
+        
+        # Add model exclusions to query
+        if model_exclusions:
+            search_suffix.extend(f'-"{phrase}"' for phrase in model_exclusions)
+            print(f"\nApplying exclusions: {', '.join(model_exclusions)}")
+        
+        # Add trusted channels to query if any
+        trusted_channels = model.sorted_view('trusted_channels')
+        if trusted_channels:
+            channel_query = ' | '.join(f'channel:"{channel}"' for channel in trusted_channels)  # YouTube API uses | for OR
+            search_suffix.append(f'({channel_query})')
+            print(f"\nPrioritizing trusted channels: {', '.join(trusted_channels)}")
+        
+        queries = []
         for query_template in patterns:
-            # Build search parts
-            search_parts = [query_template.format(game_name=game_name)]
-            
-            # Add model exclusions to query
-            if model_exclusions:
-                exclusion_terms = [f'-"{phrase}"' for phrase in model_exclusions]
-                search_parts.extend(exclusion_terms)
-                print(f"\nApplying exclusions: {', '.join(model_exclusions)}")
-            
-            # Add trusted channels to query if any
-            if model.trusted_channels:
-                channel_parts = [f'channel:"{channel}"' for channel in model.trusted_channels]
-                if channel_parts:
-                    channel_query = ' | '.join(channel_parts)  # YouTube API uses | for OR
-                    search_parts.append(f'({channel_query})')
-                    print(f"\nPrioritizing trusted channels: {', '.join(model.trusted_channels)}")
-            
             # Combine all parts into final query
-            formatted_query = ' '.join(search_parts)
+            formatted_query = ' '.join([query_template.replace('{game_name}', game_name), *search_suffix])
             print(f"\nDebug: Trying search pattern: {formatted_query}")
-            
-            # Reduced from 25 to 20 results per query to be more quota-conscious
-            results = await self.advanced_search(
+            queries.append(formatted_query)
+        
+        # The pattern searches are independent, so run them concurrently
+        # Reduced from 25 to 20 results per query to be more quota-conscious
+        responses = await asyncio.gather(*(
+            self.advanced_search(
                 formatted_query, 
                 max_results=20,
                 relevanceLanguage='en'  # Filter for English content at API level
             )
-            
+            for formatted_query in queries
+        ))
+        
+        for results in responses:
             if not results:
                 print("Debug: No results found for this pattern")
                 continue
@@ -1266,6 +1979,11 @@ class YouTubeTools:
                     continue
                 
                 title = r['title']
+                
+                # YouTube doesn't strictly honour -"phrase" in the query, so check titles too
+                if model.title_excluded(title):
+                    print(f"Debug: Filtered out excluded phrase: {title}")
+                    continue
                 description = r.get('description', '')
                 
                 # Skip if title contains non-Latin characters (quick check for obvious non-English)
@@ -1276,14 +1994,14 @@ class YouTubeTools:
                 # Try language detection on title and description
                 try:
                     # Check title language
-                    title_lang = detect(title)
+                    title_lang = self._detect_language(title)
                     if title_lang != 'en':
                         print(f"Debug: Filtered out non-English title ({title_lang}): {title}")
                         continue
                     
                     # If description exists and is long enough, check its language too
                     if len(description) > 50:  # Only check substantial descriptions
-                        desc_lang = detect(description)
+                        desc_lang = self._detect_language(description)
                         if desc_lang != 'en':
                             print(f"Debug: Filtered out due to non-English description ({desc_lang})")
                             continue
@@ -1297,9 +2015,10 @@ class YouTubeTools:
                 
             print(f"Debug: {len(filtered_results)} results remained after filtering")
             
-            # Score and store results
+            # Score and store results, measuring recency against one shared time
+            now = datetime.now(timezone.utc)
             scored_results = [
-                (video, self.score_video(video, game_type, game_name))
+                (video, self.score_video(video, game_type, game_name, now))
                 for video in filtered_results
             ]
             
@@ -1309,23 +2028,37 @@ class YouTubeTools:
             for video, score in top_scores:
                 print(f"- {video['title'][:50]}... (Score: {score})")
             
-            all_results.extend(scored_results)
-        
-        # Remove duplicates (same video from different queries)
-        unique_results = {v[0]['id']: v for v in all_results}.values()
+            # The same video often comes back from several patterns; keep its best score
+            for video, score in scored_results:
+                previous = best_results.get(video['id'])
+                if previous is None or score > previous[1]:
+                    best_results[video['id']] = (video, score)
         
         # Sort by score and take top 15 (reduced from 20)
-        final_results = sorted(unique_results, key=lambda x: x[1], reverse=True)[:15]
+        final_results = sorted(best_results.values(), key=itemgetter(1), reverse=True)[:15]
         print(f"\nDebug: Final result count: {len(final_results)}")
         
         return final_results
 
-    def score_video(self, video, game_type, game_name):
-        """Score a video based on relevance to the game."""
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _game_name_re(game_name):
+        """Regex matching the game name as a whole phrase, compiled once per game."""
+        return re.compile(rf'\b{re.escape(game_name)}\b', re.IGNORECASE)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _detect_language(text):
+        """Detect the language of a title or description, remembering earlier answers."""
+        return detect(text)
+
+    def score_video(self, video, game_type, game_name, now=None):
+        """Score a video based on relevance to the game; pass now when scoring a batch."""
         score = 0
+        lower_title = video['title'].lower()
         
         # Base score from title match
-        if re.search(rf'\b{re.escape(game_name)}\b', video['title'], re.IGNORECASE):
+        if self._game_name_re(game_name).search(video['title']):
             score += 20
         
         # View count bonus (if available)
@@ -1339,25 +2072,21 @@ class YouTubeTools:
             score += min(15, int(like_ratio * 100))  # Up to 15 points for good like ratio
         
         # Duration appropriateness (if available)
-        if 'duration' in video:
-            duration_str = video['duration']
-            # Convert duration string to minutes
-            minutes = sum(x * int(t) for x, t in zip([60, 1], re.findall(r'(\d+)[hm]', duration_str)))
-            
+        minutes = video.get('duration_minutes')
+        if minutes:
             # Different ideal durations for different content types
-            if minutes:  # Only if we successfully parsed duration
-                if 'how to play' in video['title'].lower():
-                    # Tutorial videos: 5-20 minutes ideal
-                    if 5 <= minutes <= 20:
-                        score += 10
-                elif 'review' in video['title'].lower():
-                    # Reviews: 10-30 minutes ideal
-                    if 10 <= minutes <= 30:
-                        score += 10
-                elif any(x in video['title'].lower() for x in ['playthrough', 'gameplay']):
-                    # Playthroughs: 30+ minutes ideal
-                    if minutes >= 30:
-                        score += 10
+            if 'how to play' in lower_title:
+                # Tutorial videos: 5-20 minutes ideal
+                if 5 <= minutes <= 20:
+                    score += 10
+            elif 'review' in lower_title:
+                # Reviews: 10-30 minutes ideal
+                if 10 <= minutes <= 30:
+                    score += 10
+            elif 'playthrough' in lower_title or 'gameplay' in lower_title:
+                # Playthroughs: 30+ minutes ideal
+                if minutes >= 30:
+                    score += 10
         
         # Description context bonus
         desc_lower = video.get('description', '').lower()
@@ -1368,7 +2097,7 @@ class YouTubeTools:
         if 'upload_date' in video:
             try:
                 upload_date = datetime.fromisoformat(video['upload_date'].replace('Z', '+00:00'))
-                age_days = (datetime.now() - upload_date).days
+                age_days = ((now or datetime.now(timezone.utc)) - upload_date).days
                 if age_days < 365:  # Videos less than a year old
                     score += min(10, (365 - age_days) // 36)  # Up to 10 points for recency
             except (ValueError, TypeError):
@@ -1381,8 +2110,8 @@ class YouTubeTools:
         model_file = f'model_{game_type}.json'
         try:
             if os.path.exists(model_file):
-                with open(model_file, 'r') as f:
-                    data = json.load(f)
+                with open(model_file, 'rb') as f:
+                    data = orjson.loads(f.read())
                     return SearchModel.from_dict(data)
         except Exception as e:
             print(f"Error loading {game_type} model: {e}")
@@ -1391,12 +2120,7 @@ class YouTubeTools:
 
     def _save_model(self, game_type):
         """Save a model to file."""
-        model_file = f'model_{game_type}.json'
-        try:
-            with open(model_file, 'w') as f:
-                json.dump(self.models[game_type].to_dict(), f, indent=2)
-        except Exception as e:
-            print(f"Error saving {game_type} model: {e}")
+        self._schedule_save(f'model_{game_type}.json', self.models[game_type].to_dict)
 
     async def training_session(self, game_name, game_type):
         """Interactive training session for model improvement."""
@@ -1410,19 +2134,14 @@ class YouTubeTools:
         results = await self.training_search(game_name, game_type)
         if not results:
             return
+        
+        # Set by changes that affect results, so several can share one refresh
+        changes_pending = False
             
         while True:
-            print("\nTraining Options:")
-            print("1. Flag result as irrelevant")
-            print("2. Mark channel as trusted")
-            print("3. Mark channel as noise")
-            print("4. Add exclusion phrase for this game")
-            print("5. Add persistent exclusion pattern")
-            print("6. Remove exclusion")
-            print("7. Show current model state")
-            print("8. Refresh search with current model")
-            print("9. Generate playlist with current settings")
-            print("10. Save and exit")
+            if changes_pending:
+                print("\nThe model has changed since the last search; choose 8 to refresh the results.")
+            sys.stdout.write(TRAINING_MENU)
             
             choice = await prompt_user("\nEnter choice (1-10): ")
             
@@ -1467,14 +2186,13 @@ class YouTubeTools:
                     print("No results to mark. Try refreshing the search.")
                     continue
                     
-                # Filter out channels that are already classified
-                channels_to_show = []
-                for i, result in enumerate(results, 1):
-                    channel = result['channel_title']
-                    if choice == '2' and channel not in model.trusted_channels:
-                        channels_to_show.append((i, channel))
-                    elif choice == '3' and channel not in model.noise_channels:
-                        channels_to_show.append((i, channel))
+                # Filter out channels that are already classified in the list being added to
+                classified = model.trusted_channels if choice == '2' else model.noise_channels
+                channels_to_show = [
+                    (i, result['channel_title'])
+                    for i, result in enumerate(results, 1)
+                    if result['channel_title'] not in classified
+                ]
                 
                 if not channels_to_show:
                     print("\nNo unclassified channels to mark.")
@@ -1518,12 +2236,15 @@ class YouTubeTools:
                     self._save_model(game_type)
                     
             elif choice == '6':
-                print("\nCurrent exclusions:")
-                print("Session-specific:", ', '.join(model.session_exclusions))
-                print("Persistent:", ', '.join(model.persistent_exclusions))
-                phrase = await prompt_user("Enter phrase to remove: ")
+                sys.stdout.writelines((
+                    "\nCurrent exclusions:\n",
+                    f"Session-specific: {model.joined_view('session_exclusions')}\n",
+                    f"Persistent: {model.joined_view('persistent_exclusions')}\n"
+                ))
+                # Exclusions are stored in lowercase
+                phrase = (await prompt_user("Enter phrase to remove: ")).strip().lower()
                 is_persistent = phrase in model.persistent_exclusions
-                if phrase in model.get_all_exclusions():
+                if is_persistent or phrase in model.session_exclusions:
                     model.remove_exclusion(phrase, persistent=is_persistent)
                     print(f"Removed {'persistent' if is_persistent else 'session'} exclusion: {phrase}")
                     if is_persistent:
@@ -1531,35 +2252,32 @@ class YouTubeTools:
                         self._save_model(game_type)
                     
             elif choice == '7':
-                print("\nCurrent Model State:")
-                print("Session-specific exclusions:")
-                for excl in sorted(model.session_exclusions):
-                    print(f"  - {excl}")
-                print("\nPersistent exclusions:")
-                for excl in sorted(model.persistent_exclusions):
-                    print(f"  - {excl}")
-                print("\nTrusted channels:")
-                for channel in sorted(model.trusted_channels):
-                    print(f"  - {channel}")
-                print("\nNoise channels:")
-                for channel in sorted(model.noise_channels):
-                    print(f"  - {channel}")
-                print("\nScoring weights:")
-                for k, v in model.scoring_weights.items():
-                    print(f"  {k}: {v}")
+                # Build the whole dump and write it at once
+                out = ["\nCurrent Model State:"]
+                for heading, name in (("Session-specific exclusions:", 'session_exclusions'),
+                                      ("\nPersistent exclusions:", 'persistent_exclusions'),
+                                      ("\nTrusted channels:", 'trusted_channels'),
+                                      ("\nNoise channels:", 'noise_channels')):
+                    out.append(heading)
+                    entries = model.sorted_view(name)
+                    if entries:
+                        # One join per list rather than formatting each entry
+                        out.append("  - " + "\n  - ".join(entries))
+                out.append("\nScoring weights:")
+                if model.scoring_weights:
+                    out.append(model.scoring_weights_text())
+                sys.stdout.write('\n'.join(out) + '\n')
                     
             elif choice == '8':
                 print("\nRefreshing search with current model...")
                 results = await self.training_search(game_name, game_type)
+                changes_pending = False
                 if not results:
                     print("No results found with current model settings.")
                     
             else:
                 print("Invalid choice")
                 
-            # After each change that affects results, offer to refresh
-            if choice in ['1', '2', '3', '4', '5', '6']:
-                refresh = await prompt_user("\nWould you like to refresh the search with these changes? (y/n): ")
-                if refresh.lower() == 'y':
-                    print("\nRefreshing search...")
-                    results = await self.training_search(game_name, game_type)
+            # Changes are searched together on the next refresh rather than one at a time
+            if choice in REFRESH_CHOICES:
+                changes_pending = True
@@ -1,6 +1,5 @@
 import asyncio
 from youtube_api_module import YouTubeTools
-import os
 
 async def prompt_user(message):
     return input(message).strip()
@@ -10,9 +9,10 @@ async def get_playlist_details(yt, playlist_id):
         clean_id = yt.extract_playlist_id(playlist_id)
         request = yt.youtube.playlists().list(
             part='snippet',
-            id=clean_id
+            id=clean_id,
+            fields='items(id,snippet(title,description,channelTitle,publishedAt))'
         )
-        response = request.execute()
+        response = await yt.execute_request(request)
         if response['items']:
             return response['items'][0]
         return None
@@ -25,9 +25,10 @@ async def validate_playlist(yt, playlist_id):
         clean_id = yt.extract_playlist_id(playlist_id)
         request = yt.youtube.playlists().list(
             part='snippet',
-            id=clean_id
+            id=clean_id,
+            fields='items(snippet/title)'
         )
-        response = request.execute()
+        response = await yt.execute_request(request)
         if response['items']:
             return {
                 'valid': True,
@@ -44,9 +45,10 @@ async def get_channel_id_from_username(yt, username):
             part='snippet',
             q=username,
             type='channel',
-            maxResults=5
+            maxResults=5,
+            fields='items(snippet(channelId,channelTitle))'
         )
-        response = request.execute()
+        response = await yt.execute_request(request)
 
         if response['items']:
             print('\nFound channels:')
@@ -96,8 +98,9 @@ async def combine_playlists(yt):
         # Check if input is a number referring to history
         try:
             idx = int(dest_playlist_id)
-            if 1 <= idx <= len(yt.playlist_history):
-                dest_playlist_id = yt.playlist_history[idx-1]['id']
+            recent = yt.recent_playlists()
+            if 1 <= idx <= len(recent):
+                dest_playlist_id = recent[idx-1]['id']
         except ValueError:
             pass  # Not a number, treat as regular input
             
@@ -145,14 +148,18 @@ async def combine_playlists(yt):
                 
                 print(f'Source playlist has {len(items_to_copy)} videos in the selected range.')
                 added = skipped = 0
+                # Read the destination once instead of querying it for every video. It is
+                # fetched fresh, since a stale listing would copy or skip videos wrongly
+                dest_video_ids = set(await yt.get_playlist_video_ids(dest_playlist_id, refresh=True))
 
                 for item in items_to_copy:
                     video_id = item['snippet']['resourceId']['videoId']
-                    if await yt.is_video_in_playlist(dest_playlist_id, video_id):
+                    if video_id in dest_video_ids:
                         print(f'Skipped duplicate video: {item["snippet"]["title"]}')
                         skipped += 1
                     else:
                         await yt.add_video_to_playlist(dest_playlist_id, video_id)
+                        dest_video_ids.add(video_id)
                         print(f'Added video: {item["snippet"]["title"]}')
                         added += 1
                 
@@ -176,48 +183,59 @@ async def combine_playlists(yt):
             # Multiple sources - validate all first
             print('Validating multiple sources...')
             
-            for source_id in source_ids:
+            async def resolve_source(source_id):
                 playlist_info = await validate_playlist(yt, source_id)
                 if playlist_info['valid']:
-                    print(f'Found playlist: "{playlist_info["name"]}"')
-                    continue
+                    return playlist_info, None
+                return None, await yt.get_video_details(source_id)
 
-                video_details = await yt.get_video_details(source_id)
-                if video_details:
+            # Look up every source concurrently; gather keeps the input order
+            resolved = await asyncio.gather(*(resolve_source(source_id) for source_id in source_ids))
+            for source_id, (playlist_info, video_details) in zip(source_ids, resolved):
+                if playlist_info:
+                    print(f'Found playlist: "{playlist_info["name"]}"')
+                elif video_details:
                     print(f'Found video: "{video_details["snippet"]["title"]}"')
-                    continue
-
-                print(f'Error: Could not find playlist or video with ID: {source_id}')
-                return
+                else:
+                    print(f'Error: Could not find playlist or video with ID: {source_id}')
+                    return
 
             print('\nAll sources validated. Beginning copy process...')
             total_added = total_skipped = 0
-
-            for source_id in source_ids:
-                items = await yt.get_playlist_items(source_id)
-                
-                if items:
+            # Page through the destination and all source playlists at the same time.
+            # The destination is fetched fresh so the duplicate checks see its current contents
+            dest_video_ids, *source_items = await asyncio.gather(
+                yt.get_playlist_video_ids(dest_playlist_id, refresh=True),
+                *(yt.get_playlist_items(source_id)
+                  for source_id, (playlist_info, _) in zip(source_ids, resolved) if playlist_info)
+            )
+            dest_video_ids = set(dest_video_ids)
+            source_items = iter(source_items)
+
+            for source_id, (playlist_info, video_details) in zip(source_ids, resolved):
+                if playlist_info:
+                    items = next(source_items)
                     print(f'\nProcessing playlist: {source_id}')
                     for item in items:
                         video_id = item['snippet']['resourceId']['videoId']
-                        if await yt.is_video_in_playlist(dest_playlist_id, video_id):
+                        if video_id in dest_video_ids:
                             print(f'Skipped duplicate video: {item["snippet"]["title"]}')
                             total_skipped += 1
                         else:
                             await yt.add_video_to_playlist(dest_playlist_id, video_id)
+                            dest_video_ids.add(video_id)
                             print(f'Added video: {item["snippet"]["title"]}')
                             total_added += 1
                 else:
-                    video_details = await yt.get_video_details(source_id)
-                    if video_details:
-                        print(f'\nProcessing single video: {video_details["snippet"]["title"]}')
-                        if await yt.is_video_in_playlist(dest_playlist_id, source_id):
-                            print(f'Skipped duplicate video: {video_details["snippet"]["title"]}')
-                            total_skipped += 1
-                        else:
-                            await yt.add_video_to_playlist(dest_playlist_id, source_id)
-                            print(f'Added video: {video_details["snippet"]["title"]}')
-                            total_added += 1
+                    print(f'\nProcessing single video: {video_details["snippet"]["title"]}')
+                    if source_id in dest_video_ids:
+                        print(f'Skipped duplicate video: {video_details["snippet"]["title"]}')
+                        total_skipped += 1
+                    else:
+                        await yt.add_video_to_playlist(dest_playlist_id, source_id)
+                        dest_video_ids.add(source_id)
+                        print(f'Added video: {video_details["snippet"]["title"]}')
+                        total_added += 1
 
             print(f'\nFinal Summary: Added {total_added} videos, Skipped {total_skipped} duplicates')
 
@@ -239,10 +257,8 @@ async def download_playlist(yt):
     
     print(f'Found playlist: "{playlist_info["name"]}"')
     
-    # Get output directory
+    # Get output directory; download_playlist creates it if needed
     output_dir = await prompt_user('Enter output directory (or press Enter for current directory): ')
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
     
     await yt.download_playlist(playlist_id, output_dir if output_dir else None)
 
@@ -359,23 +375,34 @@ async def merge_playlists(yt, playlists):
                 return
                 
             total_added = 0
-            # Copy videos in order
+            merged_video_ids = set()
+            # Fetch all source playlists together, then copy videos in order
+            source_items = await yt.get_multiple_playlist_items(
+                [playlists[idx-1]['id'] for idx in valid_indices]
+            )
             for idx in valid_indices:
                 source_playlist = playlists[idx-1]
-                items = await yt.get_playlist_items(source_playlist['id'])
+                items = source_items[source_playlist['id']]
                 print(f"\nCopying from: {source_playlist['title']}")
                 
                 for item in items:
                     video_id = item['snippet']['resourceId']['videoId']
+                    # Videos in more than one source are only copied the first time
+                    if video_id in merged_video_ids:
+                        print(f"Skipped duplicate: {item['snippet']['title']}")
+                        continue
                     await yt.add_video_to_playlist(new_playlist_id, video_id)
+                    merged_video_ids.add(video_id)
                     print(f"Added: {item['snippet']['title']}")
                     total_added += 1
             
-            # Delete original playlists
-            for idx in valid_indices:
-                playlist = playlists[idx-1]
-                await yt.delete_playlist(playlist['id'])
-                print(f"Deleted original playlist: {playlist['title']}")
+            # Delete original playlists. They are separate playlists, so the deletes
+            # can all go out at once
+            originals = [playlists[idx-1] for idx in valid_indices]
+            deleted = await asyncio.gather(*(yt.delete_playlist(playlist['id']) for playlist in originals))
+            for playlist, ok in zip(originals, deleted):
+                if ok:
+                    print(f"Deleted original playlist: {playlist['title']}")
                 
             print(f"\nSuccess! Created new playlist '{new_title}' with {total_added} videos")
         else:
@@ -395,7 +422,8 @@ async def view_edit_playlist(yt, playlists):
         playlist = playlists[idx]
         print(f"\nViewing playlist: {playlist['title']}")
         
-        items = await yt.get_playlist_items(playlist['id'])
+        # Keep duplicate entries so each one can be removed or reordered
+        items = await yt.get_playlist_items(playlist['id'], dedup=False)
         if not items:
             print("Playlist is empty or error occurred")
             return
@@ -433,12 +461,10 @@ async def view_edit_playlist(yt, playlists):
                     removed = 0
                     for idx in sorted(valid_indices, reverse=True):  # Remove from end to avoid index shifting
                         item = items[idx-1]
-                        try:
-                            await yt.remove_video_from_playlist(item['id'])  # Note: this is the playlistItem ID
+                        # Note: item['id'] is the playlistItem ID; failures are reported by the call
+                        if await yt.remove_video_from_playlist(playlist['id'], item['id']):
                             print(f"Removed: {item['snippet']['title']}")
                             removed += 1
-                        except Exception as e:
-                            print(f"Error removing video: {e}")
                     
                     print(f"\nSuccessfully removed {removed} video(s)")
                 else:
@@ -449,17 +475,14 @@ async def view_edit_playlist(yt, playlists):
             confirm = await prompt_user('\nReverse the order of all videos in this playlist? (yes/no): ')
             
             if confirm.lower() == 'yes':
-                # First, scan for private/deleted videos
-                private_count = 0
+                # First, scan for private/deleted videos. The lookups are independent
+                # reads, so they run concurrently
                 print("\nScanning for private/deleted videos...")
-                for item in items:
-                    video_id = item['snippet']['resourceId']['videoId']
-                    try:
-                        details = await yt.get_video_details(video_id)
-                        if not details:
-                            private_count += 1
-                    except Exception:
-                        private_count += 1
+                details = await asyncio.gather(
+                    *(yt.get_video_details(item['snippet']['resourceId']['videoId']) for item in items),
+                    return_exceptions=True
+                )
+                private_count = sum(1 for d in details if not d or isinstance(d, Exception))
                 
                 if private_count > 0:
                     print(f"\nWarning: Found {private_count} private/deleted videos in the playlist.")
@@ -495,17 +518,16 @@ async def view_edit_playlist(yt, playlists):
                 # Remove all videos from original playlist
                 removed = 0
                 for item in items:
-                    try:
-                        await yt.remove_video_from_playlist(item['id'])
+                    if await yt.remove_video_from_playlist(playlist['id'], item['id']):
                         removed += 1
-                    except Exception as e:
+                    else:
                         print(f"\nCouldn't remove video: {item['snippet']['title']}")
                     print(f"Progress: {removed}/{total} videos removed", end='\r')
                 
                 print("\n\nRestoring videos in new order...")
                 # Copy back from temp playlist in new order
                 restored = 0
-                temp_items = await yt.get_playlist_items(temp_playlist_id)
+                temp_items = await yt.get_playlist_items(temp_playlist_id, dedup=False)
                 for item in temp_items:
                     video_id = item['snippet']['resourceId']['videoId']
                     try:
@@ -669,7 +691,7 @@ async def show_playlist_history(yt):
         return
     
     print("\nRecent destination playlists:")
-    for i, playlist in enumerate(yt.playlist_history, 1):
+    for i, playlist in enumerate(yt.recent_playlists(), 1):
         print(f"{i}. {playlist['title']} ({playlist['id']})")
 
 async def generate_gameplay_playlist(yt):